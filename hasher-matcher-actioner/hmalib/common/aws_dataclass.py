@@ -28,9 +28,10 @@ How to use:
 from decimal import Decimal
 from dataclasses import dataclass, field, fields, is_dataclass
 
-import json
 import typing as t
 
+import orjson
+
 T = t.TypeVar("T")
 
 
@@ -188,7 +189,9 @@ class HasAWSSerialization:
         return py_to_aws(self)
 
     def to_aws_json(self):
-        return json.dumps(self.to_aws())
+        # These go out on every SQS/SNS hop of the pipeline, so use orjson
+        # over stdlib json
+        return orjson.dumps(self.to_aws()).decode()
 
     @classmethod
     def from_aws(cls: t.Type[T], val: t.Dict[str, t.Any]) -> T:
@@ -196,4 +199,4 @@ class HasAWSSerialization:
 
     @classmethod
     def from_aws_json(cls: t.Type[T], val: str) -> T:
-        return aws_to_py(cls, json.loads(val))
+        return aws_to_py(cls, orjson.loads(val))
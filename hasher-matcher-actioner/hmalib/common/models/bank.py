@@ -137,13 +137,17 @@ class Bank(DynamoDBItem):
 
     def to_json(self) -> t.Dict:
         """Used in APIs."""
-        result = asdict(self)
-        result.update(
-            created_at=self.created_at.isoformat(),
-            updated_at=self.updated_at.isoformat(),
-            bank_tags=list(self.bank_tags),
-        )
-        return result
+        # Built by hand rather than with asdict(), which deep-copies every
+        # field only for us to overwrite half of them.
+        return {
+            "bank_id": self.bank_id,
+            "bank_name": self.bank_name,
+            "bank_description": self.bank_description,
+            "is_active": self.is_active,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "bank_tags": list(self.bank_tags),
+        }
 
 
 @dataclass
@@ -164,6 +168,23 @@ class BankMember(DynamoDBItem):
     BANK_MEMBER_ID_INDEX = "BankMemberIdIndex"
     BANK_MEMBER_ID_INDEX_BANK_MEMBER_ID = f"{BANK_MEMBER_ID_INDEX}-BankMemberId"
 
+    # Everything from_dynamodb_item() reads. Use as a projection when that is
+    # all you need, ie. skip keys and index attributes.
+    DESERIALIZED_ATTRIBUTES = (
+        "BankId",
+        "BankMemberId",
+        "ContentType",
+        "StorageBucket",
+        "StorageKey",
+        "RawContent",
+        "Notes",
+        "CreatedAt",
+        "UpdatedAt",
+        "IsRemoved",
+        "IsMediaUnavailable",
+        "BankMemberTags",
+    )
+
     bank_id: str
     bank_member_id: str
 
@@ -239,15 +260,21 @@ class BankMember(DynamoDBItem):
         )
 
     def to_json(self) -> t.Dict:
-        """Used in APIs."""
-        result = asdict(self)
-        result.update(
-            content_type=self.content_type.get_name(),
-            created_at=self.created_at.isoformat(),
-            updated_at=self.updated_at.isoformat(),
-            bank_member_tags=list(self.bank_member_tags),
-        )
-        return result
+        """Used in APIs. Subclasses should extend the result of super()."""
+        return {
+            "bank_id": self.bank_id,
+            "bank_member_id": self.bank_member_id,
+            "content_type": self.content_type.get_name(),
+            "storage_bucket": self.storage_bucket,
+            "storage_key": self.storage_key,
+            "raw_content": self.raw_content,
+            "notes": self.notes,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "is_removed": self.is_removed,
+            "is_media_unavailable": self.is_media_unavailable,
+            "bank_member_tags": list(self.bank_member_tags),
+        }
 
 
 @dataclass
@@ -476,25 +503,32 @@ class BanksTable:
         bank_id: str,
         content_type=t.Type[ContentType],
         exclusive_start_key: t.Optional[DynamoDBCursorKey] = None,
+        projection: t.Optional[t.Sequence[str]] = None,
     ) -> PaginatedResponse[BankMember]:
+        """
+        If projection is provided, only those attributes are read from
+        dynamodb. It must include everything in
+        BankMember.DESERIALIZED_ATTRIBUTES.
+        """
         PAGE_SIZE = 100
         expected_pk = BankMember.get_pk(bank_id=bank_id, content_type=content_type)
 
-        if not exclusive_start_key:
-            result = self._table.query(
-                ScanIndexForward=False,
-                KeyConditionExpression=Key("PK").eq(expected_pk),
-                FilterExpression=Key("IsRemoved").eq(False),
-                Limit=PAGE_SIZE,
-            )
-        else:
-            result = self._table.query(
-                ScanIndexForward=False,
-                KeyConditionExpression=Key("PK").eq(expected_pk),
-                FilterExpression=Key("IsRemoved").eq(False),
-                ExclusiveStartKey=exclusive_start_key,
-                Limit=PAGE_SIZE,
-            )
+        query_kwargs: t.Dict[str, t.Any] = {}
+        if exclusive_start_key:
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+        if projection:
+            # Placeholders because some attribute names may be reserved words
+            names = {f"#proj{i}": attribute for i, attribute in enumerate(projection)}
+            query_kwargs["ProjectionExpression"] = ", ".join(names)
+            query_kwargs["ExpressionAttributeNames"] = names
+
+        result = self._table.query(
+            ScanIndexForward=False,
+            KeyConditionExpression=Key("PK").eq(expected_pk),
+            FilterExpression=Key("IsRemoved").eq(False),
+            Limit=PAGE_SIZE,
+            **query_kwargs,
+        )
 
         return PaginatedResponse(
             t.cast(DynamoDBCursorKey, result.get("LastEvaluatedKey", None)),
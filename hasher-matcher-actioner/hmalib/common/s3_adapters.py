@@ -358,8 +358,8 @@ class ThreatUpdateS3Store(tu.ThreatUpdatesStore):
         checkpoint_json = json.load(txt_content)
 
         ret = tu.ThreatUpdateCheckpoint(
-            checkpoint_json["last_fetch_time"],
-            checkpoint_json["fetch_checkpoint"],
+            last_fetch_time=checkpoint_json["last_fetch_time"],
+            fetch_checkpoint=checkpoint_json["fetch_checkpoint"],
         )
         logger.info(
             "Loaded checkpoint for privacy group %d. last_fetch_time=%d fetch_checkpoint=%d",
@@ -2,6 +2,8 @@
 
 from unittest import TestCase
 
+from threatexchange import threat_updates as tu
+
 from hmalib.common.s3_adapters import ThreatUpdateS3Store, KNOWN_SIGNAL_TYPES
 
 
@@ -21,3 +23,30 @@ class S3AdaptersTestCase(TestCase):
             assert signal_type == ThreatUpdateS3Store.get_signal_type_from_object_key(
                 store.get_s3_object_key(signal_type.INDICATOR_TYPE)
             )
+
+    def test_checkpoint_round_trip(self):
+        class FakeS3Client:
+            def __init__(self):
+                self.objects = {}
+
+            def upload_fileobj(self, fileobj, bucket_name, key):
+                self.objects[(bucket_name, key)] = fileobj.read()
+
+            def download_fileobj(self, bucket_name, key, fileobj):
+                fileobj.write(self.objects[(bucket_name, key)])
+
+        store = ThreatUpdateS3Store(
+            1,
+            1,
+            FakeS3Client(),
+            "does-not-matter",
+            "does-not-matter",
+            "does-not-matter",
+            KNOWN_SIGNAL_TYPES,
+        )
+        store._store_checkpoint(
+            tu.ThreatUpdateCheckpoint(last_fetch_time=100, fetch_checkpoint=200)
+        )
+        checkpoint = store._load_checkpoint()
+        assert checkpoint.last_fetch_time == 100
+        assert checkpoint.fetch_checkpoint == 200
@@ -65,6 +65,12 @@ class UnifiedHasher:
 
         self.supported_signal_types = supported_signal_types
 
+        # content_type -> signal_types we'd actually produce for it. Filled
+        # lazily so unlisted content types behave as they always have.
+        self._signal_types_by_content_type: t.Dict[
+            t.Type[ContentType], t.List[t.Type[SignalType]]
+        ] = {}
+
         self.output_queue_url = output_queue_url
 
     def supports(self, content_type: t.Type[ContentType]) -> bool:
@@ -73,26 +79,42 @@ class UnifiedHasher:
         """
         return content_type in self.supported_content_types
 
+    def get_signal_types_for_content(
+        self, content_type: t.Type[ContentType]
+    ) -> t.List[t.Type[SignalType]]:
+        """
+        Which of content_type's signal types will get_hashes() produce?
+        """
+        signal_types = self._signal_types_by_content_type.get(content_type)
+        if signal_types is None:
+            signal_types = [
+                signal_type
+                for signal_type in content_type.get_signal_types()
+                if signal_type in self.supported_signal_types
+                and issubclass(signal_type, BytesHasher)
+            ]
+            self._signal_types_by_content_type[content_type] = signal_types
+        return signal_types
+
     def get_hashes(
         self, content_type: t.Type[ContentType], bytes_: bytes
     ) -> t.Generator[ContentSignal, None, None]:
         """
         Yields signals for content_type.
         """
-        for signal_type in content_type.get_signal_types():
-            if signal_type in self.supported_signal_types and issubclass(
-                signal_type, BytesHasher
-            ):
-                with metrics.timer(metrics.names.hasher.hash(signal_type.get_name())):
-                    try:
-                        hash_value = signal_type.hash_from_bytes(bytes_)
-                    except Exception:
-                        logger.exception(
-                            "Encountered exception while trying to hash_from_bytes. Unable to hash content."
-                        )
-                        continue
-
-                yield ContentSignal(content_type, signal_type, hash_value)
+        for signal_type in self.get_signal_types_for_content(content_type):
+            with metrics.timer(metrics.names.hasher.hash(signal_type.get_name())):
+                try:
+                    hash_value = t.cast(
+                        t.Type[BytesHasher], signal_type
+                    ).hash_from_bytes(bytes_)
+                except Exception:
+                    logger.exception(
+                        "Encountered exception while trying to hash_from_bytes. Unable to hash content."
+                    )
+                    continue
+
+            yield ContentSignal(content_type, signal_type, hash_value)
 
     def write_hash_record(self, table: Table, hash_record: PipelineHashRecord):
         """
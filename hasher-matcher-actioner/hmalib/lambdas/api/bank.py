@@ -1,13 +1,14 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
 from functools import lru_cache
-from datetime import datetime
+from datetime import date
+import base64
 import json
+import time
 import uuid
 import bottle
 import typing as t
-from dataclasses import asdict, dataclass, field
-from urllib.parse import quote as uriencode
+from dataclasses import dataclass, field, fields
 
 import boto3
 from mypy_boto3_dynamodb.service_resource import Table
@@ -20,17 +21,27 @@ from threatexchange.content_type.photo import PhotoContent
 from threatexchange.content_type.video import VideoContent
 
 from hmalib.common.models.bank import Bank, BankMember, BanksTable, BankMemberSignal
+from hmalib.common.models.models_base import DynamoDBCursorKey, PaginatedResponse
 from hmalib.banks import bank_operations as bank_ops
 from hmalib.lambdas.api.middleware import (
     jsoninator,
     JSONifiable,
     SubApp,
 )
-from hmalib.lambdas.api.submit import create_presigned_put_url, create_presigned_url
+from hmalib.lambdas.api.submit import (
+    create_presigned_get_urls,
+    create_presigned_put_url,
+    create_presigned_url,
+)
+
+PREVIEW_URL_EXPIRATION_SECONDS = 300
 
 
 @dataclass
 class AllBanksEnvelope(JSONifiable):
+    # Hand-written because dataclass(slots=True) needs py3.10, and lambdas run py3.8
+    __slots__ = ("banks",)
+
     banks: t.List[Bank]
 
     def to_json(self) -> t.Dict:
@@ -46,18 +57,26 @@ class PreviewableBankMember(BankMember):
 
     preview_url: str = field(default_factory=lambda: "")
 
+    def to_json(self) -> t.Dict:
+        result = super().to_json()
+        result.update(preview_url=self.preview_url)
+        return result
+
 
 @dataclass
 class BankMembersPage(JSONifiable):
+    __slots__ = ("bank_members", "continuation_token")
+
     bank_members: t.List[PreviewableBankMember]
 
     # deserializes to dynamo's exclusive_start_key. Is a dict
     continuation_token: t.Optional[str]
 
     def to_json(self) -> t.Dict:
-        result = asdict(self)
-        result.update(bank_members=[member.to_json() for member in self.bank_members])
-        return result
+        return {
+            "bank_members": [member.to_json() for member in self.bank_members],
+            "continuation_token": self.continuation_token,
+        }
 
 
 @dataclass
@@ -70,20 +89,30 @@ class PreviewableBankMemberWithSignals(PreviewableBankMember):
         return result
 
 
-def with_preview_url(bank_member: BankMember) -> PreviewableBankMember:
-    previewable = PreviewableBankMember(**asdict(bank_member))
+def _shallow_asdict(obj) -> t.Dict[str, t.Any]:
+    """
+    Like dataclasses.asdict, but does not recurse or deep-copy field values.
+    Good enough for re-wrapping one dataclass into a subclass of it.
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
 
-    if bank_member.storage_bucket is None:
-        return previewable
+def with_preview_url(bank_member: BankMember) -> PreviewableBankMember:
+    # Members without storage still get wrapped (with an empty preview_url) so
+    # that API responses always carry the field.
+    preview_url = ""
+    if bank_member.storage_bucket is not None:
+        preview_url = create_presigned_url(
+            bucket_name=bank_member.storage_bucket,
+            key=bank_member.storage_key,
+            file_type=None,
+            expiration=PREVIEW_URL_EXPIRATION_SECONDS,
+            client_method="get_object",
+        )
 
-    previewable.preview_url = create_presigned_url(
-        bucket_name=bank_member.storage_bucket,
-        key=bank_member.storage_key,
-        file_type=None,
-        expiration=300,
-        client_method="get_object",
+    return PreviewableBankMember(
+        **_shallow_asdict(bank_member), preview_url=preview_url
     )
-    return previewable
 
 
 def with_preview_urls(
@@ -91,9 +120,92 @@ def with_preview_urls(
 ) -> t.List[PreviewableBankMember]:
     """
     For a list of bank_members, converts the storage details into a publicly
-    visible image for UI to work with.
+    visible image for UI to work with. Order of bank_members is preserved.
+
+    Unlike calling with_preview_url() on each, signs all the urls in one batch.
+    """
+    previewables = [
+        PreviewableBankMember(**_shallow_asdict(bank_member))
+        for bank_member in bank_members
+    ]
+    with_storage = [p for p in previewables if p.storage_bucket is not None]
+
+    preview_urls = create_presigned_get_urls(
+        [
+            (t.cast(str, p.storage_bucket), t.cast(str, p.storage_key))
+            for p in with_storage
+        ],
+        expiration=PREVIEW_URL_EXPIRATION_SECONDS,
+    )
+    for previewable, preview_url in zip(with_storage, preview_urls):
+        previewable.preview_url = t.cast(str, preview_url)
+
+    return previewables
+
+
+def _encode_continuation_token(key: DynamoDBCursorKey) -> str:
+    """
+    Opaque, url-safe form of dynamo's LastEvaluatedKey. Needs no further
+    uri-encoding to be sent back as a query parameter.
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps(key, separators=(",", ":")).encode()
+    ).decode()
+
+
+def _decode_continuation_token(token: str) -> DynamoDBCursorKey:
+    return json.loads(base64.urlsafe_b64decode(token.encode()))
+
+
+class _MembersPageCache:
+    """
+    Small TTL cache for pages of bank members read from dynamodb. UIs
+    re-request the same page a lot (refresh, back button, retries).
+
+    Lives only as long as the (warm) lambda container. Writes made through
+    this container clear it, but writes made through other containers can
+    take up to ttl_seconds to show up.
     """
-    return list(map(with_preview_url, bank_members))
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: t.Dict[
+            t.Tuple[str, str, str], t.Tuple[float, PaginatedResponse[BankMember]]
+        ] = {}
+
+    def get(
+        self, key: t.Tuple[str, str, str]
+    ) -> t.Optional[PaginatedResponse[BankMember]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, page = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return page
+
+    def put(
+        self, key: t.Tuple[str, str, str], page: PaginatedResponse[BankMember]
+    ) -> None:
+        now = time.monotonic()
+        if len(self._entries) >= self._max_size:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+        if len(self._entries) >= self._max_size:
+            # dicts are insertion ordered, so this is the oldest entry
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (now + self._ttl_seconds, page)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Preview urls are regenerated for every response, so caching pages does not
+# hand out stale urls.
+_MEMBERS_PAGE_CACHE_TTL_SECONDS = 30
+_MEMBERS_PAGE_CACHE_MAX_SIZE = 256
 
 
 @lru_cache(maxsize=None)
@@ -110,6 +222,10 @@ def get_bank_api(
 
     bank_api = SubApp()
     table_manager = BanksTable(table=bank_table)
+    members_page_cache = _MembersPageCache(
+        ttl_seconds=_MEMBERS_PAGE_CACHE_TTL_SECONDS,
+        max_size=_MEMBERS_PAGE_CACHE_MAX_SIZE,
+    )
 
     # Bank Management
 
@@ -162,11 +278,14 @@ def get_bank_api(
         Get a page of bank members. Use the "continuation_token" from this
         response to get subsequent pages.
         """
-        continuation_token = (
-            bottle.request.query.continuation_token
-            and json.loads(bottle.request.query.continuation_token)
-            or None
-        )
+        start_key = None
+        if bottle.request.query.continuation_token:
+            try:
+                start_key = _decode_continuation_token(
+                    bottle.request.query.continuation_token
+                )
+            except:
+                bottle.abort(400, "continuation_token is malformed.")
 
         try:
             content_type = get_content_type_for_name(bottle.request.query.content_type)
@@ -174,15 +293,26 @@ def get_bank_api(
         except:
             bottle.abort(400, "content_type must be provided as a query parameter.")
 
-        db_response = table_manager.get_all_bank_members_page(
-            bank_id=bank_id,
-            content_type=content_type,
-            exclusive_start_key=continuation_token,
+        cache_key = (
+            bank_id,
+            content_type.get_name(),
+            bottle.request.query.continuation_token,
         )
+        db_response = members_page_cache.get(cache_key)
+        if db_response is None:
+            db_response = table_manager.get_all_bank_members_page(
+                bank_id=bank_id,
+                content_type=content_type,
+                exclusive_start_key=start_key,
+                projection=BankMember.DESERIALIZED_ATTRIBUTES,
+            )
+            members_page_cache.put(cache_key, db_response)
 
         continuation_token = None
         if db_response.last_evaluated_key:
-            continuation_token = uriencode(json.dumps(db_response.last_evaluated_key))
+            continuation_token = _encode_continuation_token(
+                db_response.last_evaluated_key
+            )
 
         return BankMembersPage(
             bank_members=with_preview_urls(db_response.items),
@@ -210,6 +340,7 @@ def get_bank_api(
         notes = bottle.request.json["notes"]
         bank_member_tags = set(bottle.request.json["bank_member_tags"])
 
+        members_page_cache.clear()
         return with_preview_url(
             bank_ops.add_bank_member(
                 banks_table=table_manager,
@@ -243,6 +374,7 @@ def get_bank_api(
         signal_type = get_signal_types_by_name()[bottle.request.json["signal_type"]]
         signal_value = bottle.request.json["signal_value"]
 
+        members_page_cache.clear()
         return bank_ops.add_detached_bank_member_signal(
             banks_table=table_manager,
             bank_id=bank_id,
@@ -268,8 +400,8 @@ def get_bank_api(
         if (not extension) or extension[0] != ".":
             bottle.abort(400, "extension must start with a period. eg. '.mp4'")
 
-        id = str(uuid.uuid4())
-        today_fragment = datetime.now().isoformat("|").split("|")[0]  # eg. 2019-09-12
+        id = uuid.uuid4().hex
+        today_fragment = date.today().isoformat()  # eg. 2019-09-12
         s3_key = f"bank-media/{media_type}/{today_fragment}/{id}{extension}"
 
         return {
@@ -294,7 +426,7 @@ def get_bank_api(
         )
 
         return PreviewableBankMemberWithSignals(
-            **asdict(with_preview_url(member)), signals=signals
+            **_shallow_asdict(with_preview_url(member)), signals=signals
         )
 
     @bank_api.post("/update-bank-member/<bank_member_id>", apply=[jsoninator])
@@ -302,6 +434,7 @@ def get_bank_api(
         """
         Update notes and tags for a bank_member_id.
         """
+        members_page_cache.clear()
         return table_manager.update_bank_member(
             bank_member_id=bank_member_id,
             notes=bottle.request.json["notes"],
@@ -316,6 +449,7 @@ def get_bank_api(
 
         Returns empty json object.
         """
+        members_page_cache.clear()
         bank_ops.remove_bank_member(
             banks_table=table_manager,
             bank_member_id=bank_member_id,
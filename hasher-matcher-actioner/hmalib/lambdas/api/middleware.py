@@ -3,6 +3,7 @@
 import json
 import typing as t
 import bottle
+import orjson
 
 from hmalib.common.logging import get_logger
 
@@ -50,7 +51,19 @@ Sample usage:
 # that for sample usage.
 
 
+def _dumps(obj: t.Any) -> bytes:
+    """
+    orjson is several times faster than stdlib json for the response sizes
+    we produce (eg. pages of bank members) and hands bottle bytes directly.
+    OPT_NON_STR_KEYS keeps parity with json.dumps for int keyed dicts.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
 class JSONifiable:
+    # Empty so that subclasses can opt into __slots__.
+    __slots__ = ()
+
     def to_json(self) -> t.Dict:
         raise NotImplementedError
 
@@ -134,7 +147,7 @@ def jsoninator(
                 response_object = view_fn(request_object, *args, **kwargs)
 
                 bottle.response.content_type = "application/json"
-                return json.dumps(response_object.to_json())
+                return _dumps(response_object.to_json())
 
             return wrapper
 
@@ -151,7 +164,7 @@ def jsoninator(
             body = view_fn(*args, **kwargs)
 
             bottle.response.content_type = "application/json"
-            return json.dumps(body.to_json())
+            return _dumps(body.to_json())
 
         return wrapper
 
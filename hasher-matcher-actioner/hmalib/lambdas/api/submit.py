@@ -4,12 +4,15 @@ import functools
 import bottle
 import boto3
 import base64
+import hashlib
+import hmac
 import json
 import datetime
 import dataclasses
 
 from uuid import uuid4
 from enum import Enum
+from urllib.parse import quote
 from dataclasses import dataclass, asdict
 from mypy_boto3_dynamodb.service_resource import Table
 from mypy_boto3_sqs import SQSClient
@@ -45,6 +48,18 @@ def _get_sqs_client() -> SQSClient:
     return boto3.client("sqs")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_session() -> boto3.session.Session:
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3_client():
+    # Clients are thread-safe once built; building one per presign is what's
+    # expensive (endpoint resolution, credential lookup, a fresh signer).
+    return _get_session().client("s3")
+
+
 def create_presigned_put_url(bucket_name, key, file_type, expiration=3600):
     return create_presigned_url(bucket_name, key, file_type, expiration, "put_object")
 
@@ -54,7 +69,7 @@ def create_presigned_url(bucket_name, key, file_type, expiration, client_method)
     Generate a presigned URL to share an S3 object
     """
 
-    s3_client = boto3.client("s3")
+    s3_client = _get_s3_client()
     params = {
         "Bucket": bucket_name,
         "Key": key,
@@ -64,7 +79,7 @@ def create_presigned_url(bucket_name, key, file_type, expiration, client_method)
 
     try:
         response = s3_client.generate_presigned_url(
-            client_method,
+            ClientMethod=client_method,
             Params=params,
             ExpiresIn=expiration,
         )
@@ -75,6 +90,144 @@ def create_presigned_url(bucket_name, key, file_type, expiration, client_method)
     return response
 
 
+def _sigv4_uri_encode(value: str, safe: str = "") -> str:
+    # sigv4's UriEncode(): everything but A-Za-z0-9-._~ is percent-encoded
+    return quote(value, safe=safe + "~")
+
+
+class _SigV4GetObjectPresigner:
+    """
+    Hand-rolled sigv4 query-string signing for S3 get_object urls.
+
+    Everything except the host, path and final signature is the same for
+    every url signed in one batch: the scope, the derived signing key and the
+    X-Amz-* query params. These are computed once in __init__, so presign()
+    is only a sha256 and an hmac.
+
+    See: https://docs.aws.amazon.com/AmazonS3/latest/API/sigv4-query-string-auth.html
+    """
+
+    ALGORITHM = "AWS4-HMAC-SHA256"
+
+    def __init__(
+        self,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        token: t.Optional[str],
+        expiration: int,
+        now: datetime.datetime,
+    ):
+        self._region = region
+        self._amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = now.strftime("%Y%m%d")
+        self._scope = f"{date_stamp}/{region}/s3/aws4_request"
+
+        signing_key = f"AWS4{secret_key}".encode()
+        for part in (date_stamp, region, "s3", "aws4_request"):
+            signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+        self._signing_key = signing_key
+
+        query_params = {
+            "X-Amz-Algorithm": self.ALGORITHM,
+            "X-Amz-Credential": f"{access_key}/{self._scope}",
+            "X-Amz-Date": self._amz_date,
+            "X-Amz-Expires": str(expiration),
+            "X-Amz-SignedHeaders": "host",
+        }
+        if token:
+            query_params["X-Amz-Security-Token"] = token
+        self._canonical_query = "&".join(
+            f"{_sigv4_uri_encode(k)}={_sigv4_uri_encode(v)}"
+            for k, v in sorted(query_params.items())
+        )
+
+    def presign(self, bucket_name: str, key: str) -> str:
+        if "." in bucket_name:
+            # Virtual-hosted urls for dotted buckets fail TLS verification
+            host = f"s3.{self._region}.amazonaws.com"
+            path = f"/{bucket_name}/{key}"
+        else:
+            host = f"{bucket_name}.s3.{self._region}.amazonaws.com"
+            path = f"/{key}"
+        canonical_uri = _sigv4_uri_encode(path, safe="/")
+
+        canonical_request = "\n".join(
+            (
+                "GET",
+                canonical_uri,
+                self._canonical_query,
+                f"host:{host}",
+                "",
+                "host",
+                "UNSIGNED-PAYLOAD",
+            )
+        )
+        string_to_sign = "\n".join(
+            (
+                self.ALGORITHM,
+                self._amz_date,
+                self._scope,
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            )
+        )
+        signature = hmac.new(
+            self._signing_key, string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+        return f"https://{host}{canonical_uri}?{self._canonical_query}&X-Amz-Signature={signature}"
+
+
+def _get_get_object_presigner(
+    expiration: int,
+) -> t.Optional[_SigV4GetObjectPresigner]:
+    """
+    None if we can't safely sign by hand, in which case use boto3. eg. no
+    credentials, or the s3 client points somewhere other than AWS' standard
+    s3 endpoints (local testing, other partitions).
+    """
+    s3_client = _get_s3_client()
+    region = s3_client.meta.region_name
+    if not region or s3_client.meta.endpoint_url not in (
+        f"https://s3.{region}.amazonaws.com",
+        "https://s3.amazonaws.com",
+    ):
+        return None
+
+    credentials = _get_session().get_credentials()
+    if credentials is None:
+        return None
+
+    # Frozen so that a refresh can't land between reading key and token
+    frozen = credentials.get_frozen_credentials()
+    if not frozen.access_key or not frozen.secret_key:
+        return None
+    return _SigV4GetObjectPresigner(
+        region=region,
+        access_key=frozen.access_key,
+        secret_key=frozen.secret_key,
+        token=frozen.token,
+        expiration=expiration,
+        now=datetime.datetime.utcnow(),
+    )
+
+
+def create_presigned_get_urls(
+    bucket_and_keys: t.Sequence[t.Tuple[str, str]], expiration: int
+) -> t.List[t.Optional[str]]:
+    """
+    Presign get_object urls for many (bucket, key) pairs at once. Same result
+    as calling create_presigned_url(..., client_method="get_object") for each,
+    without paying for a full botocore request pipeline per url.
+    """
+    presigner = _get_get_object_presigner(expiration)
+    if presigner is None:
+        return [
+            create_presigned_url(bucket, key, None, expiration, "get_object")
+            for bucket, key in bucket_and_keys
+        ]
+    return [presigner.presign(bucket, key) for bucket, key in bucket_and_keys]
+
+
 # Request Objects
 @dataclass
 class SubmitRequestBodyBase(DictParseable):
@@ -0,0 +1,82 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import datetime
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+import boto3
+from botocore.config import Config
+
+from hmalib.lambdas.api.submit import _SigV4GetObjectPresigner
+
+
+class SigV4GetObjectPresignerTestCase(unittest.TestCase):
+    """
+    The hand-rolled presigner must produce exactly what botocore would have.
+    """
+
+    REGION = "us-west-2"
+    ACCESS_KEY = "AKIDEXAMPLE"
+    SECRET_KEY = "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"
+
+    def _assert_same_as_botocore(
+        self, bucket_name: str, key: str, token=None, addressing_style="virtual"
+    ):
+        s3_client = boto3.session.Session(
+            aws_access_key_id=self.ACCESS_KEY,
+            aws_secret_access_key=self.SECRET_KEY,
+            aws_session_token=token,
+            region_name=self.REGION,
+        ).client(
+            "s3",
+            config=Config(
+                signature_version="s3v4", s3={"addressing_style": addressing_style}
+            ),
+        )
+        expected = urlparse(
+            s3_client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket_name, "Key": key},
+                ExpiresIn=300,
+            )
+        )
+        expected_query = parse_qs(expected.query)
+
+        # Sign with the same timestamp botocore used
+        now = datetime.datetime.strptime(
+            expected_query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ"
+        )
+        actual = urlparse(
+            _SigV4GetObjectPresigner(
+                region=self.REGION,
+                access_key=self.ACCESS_KEY,
+                secret_key=self.SECRET_KEY,
+                token=token,
+                expiration=300,
+                now=now,
+            ).presign(bucket_name, key)
+        )
+
+        self.assertEqual(expected.netloc, actual.netloc)
+        self.assertEqual(expected.path, actual.path)
+        self.assertEqual(expected_query, parse_qs(actual.query))
+
+    def test_simple_key(self):
+        self._assert_same_as_botocore("hma-test-media", "photos/cat.jpg")
+
+    def test_key_needing_encoding(self):
+        self._assert_same_as_botocore(
+            "hma-test-media", "bank-media/image/png/2022-03-04/a b+c=d~é.png"
+        )
+
+    def test_session_token(self):
+        self._assert_same_as_botocore(
+            "hma-test-media",
+            "photos/cat.jpg",
+            token="FwoGZXIvYXdzEJr//////////wEaD+abc=",
+        )
+
+    def test_dotted_bucket_uses_path_style(self):
+        self._assert_same_as_botocore(
+            "hma.test.media", "photos/cat.jpg", addressing_style="path"
+        )
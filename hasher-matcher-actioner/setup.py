@@ -29,6 +29,7 @@ setup(
         "pyjwt[crypto]==2.1.0",
         "methodtools==0.4.5",
         "requests==2.27.1",
+        "orjson==3.6.6",
     ],
     extras_require=extras_require,
     entry_points={
@@ -60,7 +60,7 @@ setup(
     url="https://www.github.com/facebook/ThreatExchange",
     packages=find_packages(exclude=["tests*"]),
     install_requires=[
-        "python-Levenshtein",
+        "rapidfuzz>=2.0.0",
         "requests>=2.26.0",
         "urllib3>=1.26.0",  # For allow_methods
         "dataclasses",
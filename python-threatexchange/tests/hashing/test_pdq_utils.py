@@ -45,6 +45,14 @@ class TestPDQUtils(unittest.TestCase):
             simple_distance(test_hashes[1], test_hashes[3]), BITS_IN_PDQ // 2
         )
 
+    def test_distance_int(self):
+        for a in test_hashes:
+            for b in test_hashes:
+                self.assertEqual(
+                    simple_distance_int(hex_to_int(a), hex_to_int(b)),
+                    simple_distance_binary(hex_to_binary_str(a), hex_to_binary_str(b)),
+                )
+
     def test_match_threshold(self):
         self.assertFalse(pdq_match(test_hashes[0], test_hashes[1], threshold=31))
         self.assertTrue(
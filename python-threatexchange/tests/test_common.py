@@ -1,5 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
+import pathlib
+import tempfile
 import unittest
 
 import threatexchange.common
@@ -8,3 +10,29 @@ import threatexchange.common
 class TestCommon(unittest.TestCase):
     def test_camel_case_to_underscore(self):
         assert threatexchange.common.camel_case_to_underscore("AbcXyz") == "abc_xyz"
+
+    def test_atomic_open(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / "state.te"
+            path.write_text("old")
+            with self.assertRaises(RuntimeError):
+                with threatexchange.common.atomic_open(path) as f:
+                    f.write("partial")
+                    raise RuntimeError
+            assert path.read_text() == "old"
+            with threatexchange.common.atomic_open(path) as f:
+                f.write("new")
+            assert path.read_text() == "new"
+            assert [p.name for p in pathlib.Path(d).iterdir()] == ["state.te"]
+
+    def test_normalize_url(self):
+        for url, expected in (
+            # simple enough to skip urlparse()
+            ("HTTPS://www.Facebook.com/?user=123", b"www.facebook.com/?user=123"),
+            ("www.facebook.com/a/b", b"www.facebook.com/a/b"),
+            # need urlparse()
+            ("https://www.facebook.com/?", b"www.facebook.com/"),
+            ("https://www.facebook.com:443/#top", b"www.facebook.com:443/#top"),
+            ("ftp://files.facebook.com/", b"files.facebook.com/"),
+        ):
+            assert threatexchange.common.normalize_url(url) == expected, url
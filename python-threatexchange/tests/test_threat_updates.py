@@ -0,0 +1,22 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import pathlib
+import tempfile
+import unittest
+
+from threatexchange.threat_updates import (
+    ThreatUpdateCheckpoint,
+    ThreatUpdateFileStore,
+)
+
+
+class TestThreatUpdateFileStore(unittest.TestCase):
+    def test_checkpoint_round_trip(self):
+        with tempfile.TemporaryDirectory() as d:
+            store = ThreatUpdateFileStore(pathlib.Path(d), 1234, 5678)
+            store._store_checkpoint(
+                ThreatUpdateCheckpoint(last_fetch_time=100, fetch_checkpoint=200)
+            )
+            checkpoint = store._load_checkpoint()
+            assert checkpoint.last_fetch_time == 100
+            assert checkpoint.fetch_checkpoint == 200
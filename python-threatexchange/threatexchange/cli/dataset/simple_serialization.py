@@ -11,10 +11,15 @@ import re
 import typing as t
 
 from ...api import ThreatExchangeAPI
-from ... import threat_updates
+from ... import common, threat_updates
 from ...descriptor import SimpleDescriptorRollup
 from ...dataset import Dataset
 
+# Matches the files written by the store() methods below, capturing the type
+_SIMPLE_STATE_FILE_RE = re.compile(r"simple\.([^.]+)" + re.escape(Dataset.EXTENSION))
+_SIMPLE_STATE_FILE_GLOB = f"simple.*{Dataset.EXTENSION}"
+
+
 # TODO - merge SimpleDescriptorRollup here
 class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
     """A short compact serialization optimized for the CLI"""
@@ -35,7 +40,7 @@ class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
 
     def as_csv_row(self) -> t.Tuple:
         """As a simple record type for the threatexchange CLI cache"""
-        return (self.indicator,) + self.rollup.as_row()
+        return self.rollup.as_row_after(self.indicator)
 
     @classmethod
     def from_threat_updates_json(cls, app_id, te_json):
@@ -62,33 +67,29 @@ class CliIndicatorSerialization(threat_updates.ThreatUpdateSerialization):
         for threat_type, items in row_by_type.items():
             path = state_dir / f"simple.{threat_type}{Dataset.EXTENSION}"
             ret.append(path)
-            with path.open("w", encoding="utf-8", newline="") as f:
-                writer = csv.writer(f)
-                for item in items:
-                    writer.writerow(item.as_csv_row())
+            with common.atomic_open(path, encoding="utf-8", newline="") as f:
+                # writerows keeps the per-row loop inside the csv module
+                csv.writer(f).writerows(item.as_csv_row() for item in items)
         return ret
 
     @classmethod
     def load(cls, state_dir: pathlib.Path) -> t.Iterable["CliIndicatorSerialization"]:
         """Load this serialization from the state directory"""
-        ret = []
-        pattern = r"simple\.([^.]+)" + re.escape(Dataset.EXTENSION)
-        for path in state_dir.glob(f"simple.*{Dataset.EXTENSION}"):
-            match = re.match(pattern, path.name)
+        ret: t.List["CliIndicatorSerialization"] = []
+        # Bound once, the loop below runs once per stored indicator
+        rollup_from_row = SimpleDescriptorRollup.from_row
+        for path in state_dir.glob(_SIMPLE_STATE_FILE_GLOB):
+            match = _SIMPLE_STATE_FILE_RE.match(path.name)
             if not match or not path.is_file():
                 continue
             indicator_type = match.group(1)
             # Violate your warranty with class state! Not threadsafe!
             csv.field_size_limit(path.stat().st_size)  # dodge field size problems
             with path.open("r", encoding="utf-8", newline="") as f:
-                for row in csv.reader(f):
-                    ret.append(
-                        cls(
-                            indicator_type,
-                            row[0],
-                            SimpleDescriptorRollup.from_row(row[1:]),
-                        )
-                    )
+                ret.extend(
+                    cls(indicator_type, row[0], rollup_from_row(row[1:]))
+                    for row in csv.reader(f)
+                )
         return ret
 
 
@@ -115,7 +116,7 @@ class HMASerialization(CliIndicatorSerialization):
 
     def as_csv_row(self) -> t.Tuple:
         """indicator details and descriptor rollup without descriptor ID"""
-        return (self.indicator, self.indicator_id) + self.rollup.as_row()
+        return self.rollup.as_row_after(self.indicator, self.indicator_id)
 
     @classmethod
     def from_threat_updates_json(cls, app_id, te_json):
@@ -140,18 +141,17 @@ class HMASerialization(CliIndicatorSerialization):
     @classmethod
     def load(cls, state_dir: pathlib.Path) -> t.Iterable["HMASerialization"]:
         """Load this serialization from the state directory"""
-        ret = []
-        pattern = r"simple\.([^.]+)" + re.escape(Dataset.EXTENSION)
-        for path in state_dir.glob(f"simple.*{Dataset.EXTENSION}"):
-            match = re.match(pattern, path.name)
+        ret: t.List["HMASerialization"] = []
+        for path in state_dir.glob(_SIMPLE_STATE_FILE_GLOB):
+            match = _SIMPLE_STATE_FILE_RE.match(path.name)
             if not match or not path.is_file():
                 continue
             indicator_type = match.group(1)
             # Violate your warranty with class state! Not threadsafe!
             csv.field_size_limit(path.stat().st_size)  # dodge field size problems
             with path.open("r", newline="") as f:
-                for row in csv.reader(f):
-                    ret.append(cls.from_csv_row(row, indicator_type))
+                from_csv_row = cls.from_csv_row
+                ret.extend(from_csv_row(row, indicator_type) for row in csv.reader(f))
         return ret
 
 
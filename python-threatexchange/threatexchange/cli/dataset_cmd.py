@@ -146,7 +146,7 @@ class DatasetCommand(command_base.Command):
         for indicator in indicators.values():
             for name, signal_type in signal_types.items():
                 if signal_type.indicator_applies(
-                    indicator.indicator_type, list(indicator.rollup.labels)
+                    indicator.indicator_type, indicator.rollup.labels
                 ):
                     by_signal[name] += 1
         for name, count in sorted(by_signal.items(), key=lambda i: -i[1]):
@@ -164,13 +164,18 @@ class DatasetCommand(command_base.Command):
 def generate_cli_indices(dataset: Dataset, indicator_stores):
     signal_types = meta.get_signal_types_by_name()
     indicators: t.Dict[str, t.List] = {name: [] for name in signal_types}
+    # The CLI stores for every privacy group share the same state files, so
+    # merge by key first rather than matching (and indexing) each indicator
+    # once per privacy group
+    all_indicators: t.Dict[str, CliIndicatorSerialization] = {}
     for store in indicator_stores:
-        for indicator in store.load_state().values():
-            for name, signal_type in signal_types.items():
-                if signal_type.indicator_applies(
-                    indicator.indicator_type, indicator.rollup.labels
-                ):
-                    indicators[name].append(indicator)
+        all_indicators.update(store.load_state())
+    for indicator in all_indicators.values():
+        for name, signal_type in signal_types.items():
+            if signal_type.indicator_applies(
+                indicator.indicator_type, indicator.rollup.labels
+            ):
+                indicators[name].append(indicator)
 
     for name, signal_type in signal_types.items():
         index_cls = signal_type.get_index_cls()
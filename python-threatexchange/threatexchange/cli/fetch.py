@@ -4,24 +4,30 @@
 import argparse
 import collections
 import concurrent.futures
-import csv
-import datetime
-import json
-import os
-import pathlib
+import threading
 import time
 import typing as t
 
 from .. import threat_updates
 from ..api import ThreatExchangeAPI
-from ..content_type import meta
 from ..dataset import Dataset
-from ..descriptor import SimpleDescriptorRollup
-from ..signal_type import signal_base
 from . import command_base
 from . import dataset_cmd
 from .dataset.simple_serialization import CliIndicatorSerialization
 
+# (name, seconds) from largest to smallest, for FetchCommand._print_progress
+_DURATION_UNITS = (
+    ("year", 365 * 24 * 60 * 60),
+    ("day", 24 * 60 * 60),
+    ("hour", 60 * 60),
+    ("minute", 60),
+    ("second", 1),
+)
+
+
+class _FetchStopped(Exception):
+    """Raised in fetch threads to stop them early, see _fetch_concurrently"""
+
 
 class FetchCommand(command_base.Command):
     """
@@ -36,6 +42,8 @@ class FetchCommand(command_base.Command):
     """
 
     PROGRESS_PRINT_INTERVAL_SEC = 30
+    # Privacy groups fetched at the same time, see execute()
+    MAX_CONCURRENT_FETCHES = 8
 
     @classmethod
     def init_argparse(cls, ap) -> None:
@@ -71,15 +79,30 @@ class FetchCommand(command_base.Command):
         # Progress
         self.current_pgroup = 0
         self.last_update_time = 0
-        # Print first update after 5 seconds
-        self.last_update_printed = time.time() - self.PROGRESS_PRINT_INTERVAL_SEC + 5
+        # Print first update after 5 seconds. A monotonic deadline, so the
+        # per-update check in _progress is a single clock read and compare
+        self._next_progress_print = time.monotonic() + 5
         self.processed = 0
-        self.counts: t.Dict[str, int] = collections.Counter()
+        self.counts: t.Counter[str] = collections.Counter()
+        # _progress is called from fetch threads
+        self._progress_lock = threading.Lock()
 
     def execute(self, api: ThreatExchangeAPI, dataset: Dataset) -> None:
         privacy_groups = dataset.config.privacy_groups
+        # Each privacy group is its own series of /threat_updates round trips,
+        # so fetch them concurrently. Applying the updates stays sequential,
+        # since every store shares the same state files. --limit needs a
+        # running count across privacy groups, so it fetches one at a time.
+        max_workers = 1
+        if self.limit is None:
+            max_workers = min(len(privacy_groups), self.MAX_CONCURRENT_FETCHES)
         stores = []
+        pending = []
         for privacy_group in privacy_groups:
+            # --limit caps the whole fetch, not each privacy group
+            remaining = None if self.limit is None else self.limit - self.processed
+            if remaining is not None and remaining <= 0:
+                break
             indicator_store = threat_updates.ThreatUpdateFileStore(
                 dataset.state_dir,
                 privacy_group,
@@ -104,18 +127,17 @@ class FetchCommand(command_base.Command):
             delta = indicator_store.next_delta
             if self.stop_time:
                 delta.end = self.stop_time
+            if max_workers > 1:
+                pending.append((indicator_store, delta))
+                continue
             try:
-                delta.incremental_sync_from_threatexchange(
-                    api, limit=self.limit, progress_fn=self._progress
-                )
-            except:
-                self.stderr("Exception occurred! Attempting to save...")
-                # Force delta to show finished
-                delta.end = delta.current
-                raise
+                self._fetch_delta(api, delta, remaining)
             finally:
                 if delta:
-                    indicator_store.apply_updates(delta)
+                    self._apply_updates(indicator_store, delta)
+
+        if pending:
+            self._fetch_concurrently(api, pending, max_workers)
 
         self.stderr(f"Processed {self.processed} updates:")
 
@@ -128,15 +150,97 @@ class FetchCommand(command_base.Command):
             self.stderr("Rebuilding match indices...")
             dataset_cmd.generate_cli_indices(dataset, stores)
 
+    def _fetch_delta(
+        self,
+        api: ThreatExchangeAPI,
+        delta: threat_updates.ThreatUpdatesDelta,
+        limit: t.Optional[int] = None,
+        progress_fn: t.Optional[
+            t.Callable[[threat_updates.ThreatUpdateJSON], None]
+        ] = None,
+    ) -> None:
+        try:
+            delta.incremental_sync_from_threatexchange(
+                api, limit=limit, progress_fn=progress_fn or self._progress
+            )
+        except:
+            self.stderr("Exception occurred! Attempting to save...")
+            # Force delta to show finished
+            delta.end = delta.current
+            raise
+
+    def _fetch_concurrently(
+        self,
+        api: ThreatExchangeAPI,
+        pending: t.List[
+            t.Tuple[
+                threat_updates.ThreatUpdateFileStore, threat_updates.ThreatUpdatesDelta
+            ]
+        ],
+        max_workers: int,
+    ) -> None:
+        # Progress comes from several privacy groups at once now
+        self.current_pgroup = 0
+        stop = threading.Event()
+
+        def progress(update: threat_updates.ThreatUpdateJSON) -> None:
+            # Called after one_fetch() has stored the whole page, so stopping
+            # here leaves delta.current consistent with delta.updates
+            if stop.is_set():
+                raise _FetchStopped()
+            self._progress(update)
+
+        futures: t.List[concurrent.futures.Future] = []
+        error = None
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+                futures = [
+                    ex.submit(self._fetch_delta, api, delta, progress_fn=progress)
+                    for _, delta in pending
+                ]
+                try:
+                    concurrent.futures.wait(futures)
+                except BaseException:
+                    # i.e. Ctrl-C - have the workers stop after their current
+                    # page, rather than waiting for every fetch to finish
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            # Like the sequential path, save whatever was fetched, even if
+            # interrupted
+            for (indicator_store, delta), future in zip(pending, futures):
+                if future.cancelled():
+                    continue
+                if error is None:
+                    error = future.exception()
+                if delta:
+                    self._apply_updates(indicator_store, delta)
+        if error is not None:
+            raise error
+
+    def _apply_updates(
+        self,
+        indicator_store: threat_updates.ThreatUpdateFileStore,
+        delta: threat_updates.ThreatUpdatesDelta,
+    ) -> None:
+        indicator_store.apply_updates(delta)
+        # Tallied per delta rather than in _progress, so Counter can do the
+        # counting in bulk instead of a dict update per fetched record
+        updates = delta.updates
+        self.counts.update(u.threat_type for u in updates if not u.should_delete)
+        self.counts.subtract(u.threat_type for u in updates if u.should_delete)
+
     def _progress(self, update: threat_updates.ThreatUpdateJSON) -> None:
-        self.processed += 1
-        self.counts[update.threat_type] += -1 if update.should_delete else 1
-        self.last_update_time = update.time
+        with self._progress_lock:
+            self.processed += 1
+            self.last_update_time = update.time
 
-        now = time.time()
-        if now - self.last_update_printed >= self.PROGRESS_PRINT_INTERVAL_SEC:
-            self.last_update_printed = now
-            self._print_progress()
+            now = time.monotonic()
+            if now >= self._next_progress_print:
+                self._next_progress_print = now + self.PROGRESS_PRINT_INTERVAL_SEC
+                self._print_progress()
 
     def _print_progress(self):
         processed = ""
@@ -153,17 +257,9 @@ class FetchCommand(command_base.Command):
         elif self.last_update_time >= time.time():
             from_time = "moments ago"
         else:
-            delta = datetime.datetime.utcfromtimestamp(
-                time.time()
-            ) - datetime.datetime.utcfromtimestamp(self.last_update_time)
+            delta = int(time.time() - self.last_update_time)
             parts = []
-            for name, div in (
-                ("year", datetime.timedelta(days=365)),
-                ("day", datetime.timedelta(days=1)),
-                ("hour", datetime.timedelta(hours=1)),
-                ("minute", datetime.timedelta(minutes=1)),
-                ("second", datetime.timedelta(seconds=1)),
-            ):
+            for name, div in _DURATION_UNITS:
                 val, delta = divmod(delta, div)
                 if val or parts:
                     parts.append((val, name))
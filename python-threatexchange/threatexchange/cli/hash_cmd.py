@@ -69,9 +69,7 @@ class HashCommand(command_base.Command):
         as_text: bool,
         content: t.Union[t.List[str], t.TextIO],
     ) -> None:
-        self.content_type = [
-            c for c in meta.get_all_content_types() if c.get_name() == content_type
-        ][0]
+        self.content_type = meta.get_content_type_for_name(content_type)
         self.signal_type = signal_type
 
         if content == [self.USE_STDIN]:
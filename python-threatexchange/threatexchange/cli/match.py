@@ -100,9 +100,7 @@ class MatchCommand(command_base.Command):
         show_false_positives: bool,
         hide_disputed: bool,
     ) -> None:
-        self.content_type = [
-            c for c in meta.get_all_content_types() if c.get_name() == content_type
-        ][0]
+        self.content_type = meta.get_content_type_for_name(content_type)
         self.input_generator = self.parse_input(content, hashes, as_text)
         self.as_hashes = hashes
         self.show_false_positives = show_false_positives
@@ -159,14 +157,17 @@ class MatchCommand(command_base.Command):
             s for s in all_signal_types if isinstance(s, StrMatcher)
         ]
 
+        match_file = lambda s, t: s.match_file(t)
         match_str = lambda s, t: s.match(t)
         if self.as_hashes:
             match_str = lambda s, t: s.match_hash(t)
             str_matchers = [s for s in all_signal_types if isinstance(s, HashMatcher)]
 
+        # Builds a new set on each access, so only do that once
+        labels_for_collaboration = dataset.config.labels_for_collaboration
         seen = set()
         for inp in self.input_generator:
-            match_fn = lambda s, t: s.match_file(t)
+            match_fn = match_file
             signal_types = file_matchers
             if isinstance(inp, str):
                 match_fn = match_str
@@ -178,9 +179,7 @@ class MatchCommand(command_base.Command):
                         continue
                     seen.add(match.primary_descriptor_id)
                     labels = sorted(
-                        l
-                        for l in match.labels
-                        if l in dataset.config.labels_for_collaboration
+                        l for l in match.labels if l in labels_for_collaboration
                     )
                     # If a lone DISPUTED, this means it is just a lone NON_MALICIOUS
                     # No one does this intentionally, it means that it was originally
@@ -246,8 +246,11 @@ class TagFetchCommand(command_base.Command):
                     self.stderr(f"Processed {counts['all']}...")
                 return len(descriptors)
 
-            for tag_name in tags_to_fetch:
-                tag_id = api.get_tag_id(tag_name)
+            # The tag lookups are independent round trips, so resolve them all
+            # at once rather than one per loop iteration below
+            tag_ids = list(id_fetch_pool.map(api.get_tag_id, tags_to_fetch))
+
+            for tag_id in tag_ids:
                 if not tag_id:
                     continue
                 pending_futures: t.Deque[
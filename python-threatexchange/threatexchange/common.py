@@ -7,10 +7,28 @@ A place to put simple helpers that don't seem like they go anywhere else.
 If this file starts getting large, break it up.
 """
 
+import contextlib
+import hashlib
+import os
+import pathlib
 import re
+import typing as t
 from urllib.parse import urlparse
 import unicodedata
 
+# MD5 here is only for matching, never security. Saying so keeps FIPS-mode
+# OpenSSL builds from refusing it, but the argument only exists on 3.9+
+try:
+    hashlib.md5(usedforsecurity=False)  # type: ignore
+    _MD5_KWARGS: t.Dict[str, t.Any] = {"usedforsecurity": False}
+except TypeError:
+    _MD5_KWARGS = {}
+
+
+def md5(data: bytes = b"") -> "hashlib._Hash":
+    """hashlib.md5, marked as not for security where supported"""
+    return hashlib.md5(data, **_MD5_KWARGS)
+
 
 def class_name_to_human_name(name: str, suffix: str) -> str:
     """Helper to make human-friendly names using a class name as a template"""
@@ -29,6 +47,14 @@ def camel_case_to_underscore(name: str) -> str:
     return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
 
 
+# Compiled once for normalize_string, which runs for every indexed and queried
+# string. Note that the repeats pattern isn't a raw string, so its \1 is a
+# literal \x01 rather than a backreference; kept as-is so normalized output
+# doesn't change.
+_NORMALIZE_REPEATS_RE = re.compile("(.)(\1)+")
+_NORMALIZE_NON_ALNUM_RE = re.compile("[\W_]")
+
+
 def normalize_string(s: str) -> str:
     """
     Strip parts of the raw string to try and make matching more effective.
@@ -47,13 +73,21 @@ def normalize_string(s: str) -> str:
     )
     # Strip repeats of 2+
     # w0000000t => w00t
-    s = re.sub("(.)(\1)+", "\1\1", s)
+    s = _NORMALIZE_REPEATS_RE.sub("\1\1", s)
     # Strip non alphanumerics (including spaces)
     #
-    s = re.sub("[\W_]", "", s)
+    s = _NORMALIZE_NON_ALNUM_RE.sub("", s)
     return s
 
 
+# URLs that come back from urlparse().geturl() unchanged, so normalize_url()
+# only has to strip an http(s) scheme. That means no ":", ";", "#" or "@" past
+# the scheme, and no empty query, since geturl() drops a trailing "?".
+_CANONICAL_URL_RE = re.compile(
+    r"(?:https?://)?([a-z0-9][a-z0-9.\-_~%/=&+]*(?:\?[a-z0-9.\-_~%/=&+?]+)?)\Z"
+)
+
+
 def normalize_url(url: str) -> bytes:
     """
     Normalize the URL and strip the scheme from the URL to make matching more effective.
@@ -63,6 +97,10 @@ def normalize_url(url: str) -> bytes:
     # Lowercase
     # HtTPs://wWw.faCeBook.cOM => https://www.facebook.com
     url = url.lower()
+    # Most URLs are simple enough to skip urlparse(), see _CANONICAL_URL_RE
+    canonical = _CANONICAL_URL_RE.match(url)
+    if canonical:
+        return canonical.group(1).encode("utf-8")
     # parse the Url into it's consituent parts
     parsed = urlparse(url)
     # identify the scheme and trailing punctuation
@@ -73,3 +111,23 @@ def normalize_url(url: str) -> bytes:
     url = parsed.geturl().replace(scheme, "", 1)
     # Ensure URL is utf-8 encoded
     return url.encode("utf-8")
+
+
+@contextlib.contextmanager
+def atomic_open(path: pathlib.Path, mode: str = "w", **kwargs) -> t.Iterator[t.IO]:
+    """
+    Open a file for writing that only replaces `path` once fully written.
+
+    Writes go to a temporary file next to `path`, which is moved over it with
+    os.replace() on success, so a crash or exception mid-write leaves the
+    previous contents intact rather than a truncated file.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp.open(mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
@@ -5,47 +5,50 @@
 Stores all the content type implementations for lookup
 """
 
-import functools
 import typing as t
 
 from . import content_base, text, video, photo, pdf, url
 from ..signal_type import signal_base
 
+# These are all fixed at import time, so build them once here rather than
+# paying for an lru_cache wrapper on every lookup.
+_ALL_CONTENT_TYPES: t.List[t.Type[content_base.ContentType]] = [
+    text.TextContent,
+    video.VideoContent,
+    photo.PhotoContent,
+    pdf.PDFContent,
+    url.URL,
+]
+
+_CONTENT_TYPES_BY_NAME: t.Dict[str, t.Type[content_base.ContentType]] = {
+    c.get_name(): c for c in _ALL_CONTENT_TYPES
+}
+
+_ALL_SIGNAL_TYPES: t.Set[t.Type[signal_base.SignalType]] = {
+    s for c in _ALL_CONTENT_TYPES for s in c.get_signal_types()
+}
+
+_SIGNAL_TYPES_BY_NAME: t.Dict[str, t.Type[signal_base.SignalType]] = {
+    s.get_name(): s for s in _ALL_SIGNAL_TYPES
+}
+
 
-@functools.lru_cache(1)
 def get_all_content_types() -> t.List[t.Type[content_base.ContentType]]:
     """Returns all content_type implementations for commands"""
-    return [
-        text.TextContent,
-        video.VideoContent,
-        photo.PhotoContent,
-        pdf.PDFContent,
-        url.URL,
-    ]
+    return _ALL_CONTENT_TYPES
 
 
-@functools.lru_cache(1)
 def get_content_types_by_name() -> t.Dict[str, t.Type[content_base.ContentType]]:
-    return {c.get_name(): c for c in get_all_content_types()}
+    return _CONTENT_TYPES_BY_NAME
 
 
-@functools.lru_cache(1)
 def get_all_signal_types() -> t.Set[t.Type[signal_base.SignalType]]:
     """Returns all signal_type implementations for commands"""
-    return {s for c in get_all_content_types() for s in c.get_signal_types()}
+    return _ALL_SIGNAL_TYPES
 
 
-@functools.lru_cache(1)
 def get_signal_types_by_name() -> t.Dict[str, t.Type[signal_base.SignalType]]:
-    return {s.get_name(): s for s in get_all_signal_types()}
-
-
-@functools.lru_cache(maxsize=None)
-def _get_content_type_map():
-    return {
-        content_type.get_name(): content_type
-        for content_type in get_all_content_types()
-    }
+    return _SIGNAL_TYPES_BY_NAME
 
 
 def get_content_type_for_name(name: str) -> t.Type[content_base.ContentType]:
@@ -55,4 +58,4 @@ def get_content_type_for_name(name: str) -> t.Type[content_base.ContentType]:
 
     Note: Raises KeyError if not found.
     """
-    return _get_content_type_map()[name]
+    return _CONTENT_TYPES_BY_NAME[name]
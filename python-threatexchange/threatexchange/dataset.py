@@ -11,10 +11,11 @@ There are a few categories of state that this wraps:
 """
 
 import json
+import os
 import pathlib
 import typing as t
 
-from . import collab_config
+from . import collab_config, common
 from .content_type import meta
 from .signal_type import signal_base
 from .signal_type import index
@@ -77,14 +78,15 @@ class Dataset:
         self, fetch_started_timestamp: float, full_fetch: bool
     ) -> None:
         prev = self.get_fetch_checkpoint()
-        with self._fetch_checkpoint_path().open("w+") as f:
+        with common.atomic_open(self._fetch_checkpoint_path()) as f:
             f.write(prev.next(fetch_started_timestamp, full_fetch).serialize())
 
     def get_fetch_checkpoint(self) -> FetchCheckpoint:
-        checkpoint = self._fetch_checkpoint_path()
-        if not checkpoint.exists():
+        try:
+            serialized = self._fetch_checkpoint_path().read_text()
+        except FileNotFoundError:
             return FetchCheckpoint(0, 0)
-        return FetchCheckpoint.deserialize(checkpoint.read_text())
+        return FetchCheckpoint.deserialize(serialized)
 
     def _signal_state_file(self, signal_type: signal_base.SignalType) -> pathlib.Path:
         return self.state_dir / f"{signal_type.get_name()}{self.EXTENSION}"
@@ -103,10 +105,15 @@ class Dataset:
         """Load everything in the state directory and initialize signal types"""
         if signal_types is None:
             signal_types = [s() for s in meta.get_all_signal_types()]
+        # One directory listing instead of an exists() stat per signal type
+        stored = set()
+        if self.state_dir.is_dir():
+            with os.scandir(self.state_dir) as it:
+                stored = {entry.name for entry in it}
         ret = []
         for signal_type in signal_types:
             signal_state_file = self._signal_state_file(signal_type)
-            if signal_state_file.exists():
+            if signal_state_file.name in stored:
                 signal_type.load(signal_state_file)
             ret.append(signal_type)
         return ret
@@ -119,7 +126,7 @@ class Dataset:
             if path.exists():
                 path.unlink()
             return
-        with path.open("wb") as fout:
+        with common.atomic_open(path, "wb") as fout:
             index.serialize(fout)
 
     def load_index(
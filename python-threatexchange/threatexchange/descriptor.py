@@ -125,7 +125,7 @@ class SimpleDescriptorRollup:
     __slots__ = ["first_descriptor_id", "added_on", "labels"]
 
     def __init__(
-        self, first_descriptor_id: int, added_on: str, labels: t.Set[str]
+        self, first_descriptor_id: int, added_on: str, labels: t.Iterable[str]
     ) -> None:
         self.first_descriptor_id = first_descriptor_id
         self.added_on = added_on  # TODO - convert to int?
@@ -178,13 +178,24 @@ class SimpleDescriptorRollup:
         """Simple conversion to CSV row"""
         return self.first_descriptor_id, self.added_on, " ".join(self.labels)
 
+    def as_row_after(self, *leading: t.Any) -> t.Tuple[t.Any, ...]:
+        """
+        Same as `leading + as_row()`, but builds the row in one go rather than
+        allocating and then concatenating two tuples per row.
+        """
+        return (
+            *leading,
+            self.first_descriptor_id,
+            self.added_on,
+            " ".join(self.labels),
+        )
+
     @classmethod
     def from_row(cls, row: t.List) -> "SimpleDescriptorRollup":
         """Simple conversion from CSV row"""
-        labels = []
-        if row[2]:
-            labels = row[2].split(" ")
-        return cls(int(row[0]), row[1], set(labels))
+        # __init__ already copies labels into a set, don't set() twice
+        labels: t.Iterable[str] = row[2].split(" ") if row[2] else ()
+        return cls(int(row[0]), row[1], labels)
 
     @classmethod
     def from_threat_updates_json(
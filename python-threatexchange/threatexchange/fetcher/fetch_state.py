@@ -44,6 +44,10 @@ class SignalOpinion:
     @see threatexchange.fetch_api.SignalExchangeAPI
     """
 
+    # Fetches can materialize a lot of these. dataclass(slots=True) is 3.10+,
+    # but declaring them by hand works as long as no field has a default.
+    __slots__ = ("owner", "category", "tags")
+
     owner: int
     category: SignalOpinionCategory
     tags: t.List[str]
@@ -61,6 +65,8 @@ class FetchedSignalDataBase:
     will need to store that here.
     """
 
+    __slots__ = ("opinions",)
+
     opinions: t.List[SignalOpinion]
 
 
@@ -86,6 +86,9 @@ class SignalTypeIndex(t.Generic[T]):
         internal_mapping[idx] = meta
     """
 
+    # Lets implementations use __slots__ if they want to
+    __slots__ = ()
+
     def query(self, hash: str) -> t.List[IndexMatch[T]]:
         """
         Look up entries against the index, up to the max supported distance.
@@ -10,7 +10,7 @@ import pathlib
 import warnings
 
 from . import signal_base
-from ..hashing.pdq_utils import pdq_match, BITS_IN_PDQ
+from ..hashing.pdq_utils import hex_to_int, simple_distance_int, BITS_IN_PDQ
 
 
 def _raise_pillow_warning():
@@ -44,6 +44,12 @@ class PdqSignal(
     # Hashes of distance less than or equal to this threshold are considered a 'match'
     PDQ_CONFIDENT_MATCH_THRESHOLD = 31
 
+    def __init__(self) -> None:
+        super().__init__()
+        # hex -> hex_to_int(hex) for hashes in state, so each stored hash is
+        # only parsed once rather than on every match_hash() scan
+        self._state_ints: t.Dict[str, int] = {}
+
     @classmethod
     def hash_from_file(cls, file: pathlib.Path) -> str:
         try:
@@ -61,11 +67,26 @@ class PdqSignal(
         if len(signal_str) != BITS_IN_PDQ / 4:
             return []
 
-        return [
-            signal_base.SignalMatch(signal_attr.labels, signal_attr.first_descriptor_id)
-            for pdq_hash, signal_attr in self.state.items()
-            if pdq_match(pdq_hash, signal_str, self.PDQ_CONFIDENT_MATCH_THRESHOLD)
-        ]
+        # Parse the query once, instead of once per comparison
+        query = hex_to_int(signal_str)
+        threshold = self.PDQ_CONFIDENT_MATCH_THRESHOLD
+        state_ints = self._state_ints
+        matches = []
+        for pdq_hash, signal_attr in self.state.items():
+            pdq_int = state_ints.get(pdq_hash)
+            if pdq_int is None:
+                pdq_int = state_ints[pdq_hash] = hex_to_int(pdq_hash)
+            if simple_distance_int(pdq_int, query) <= threshold:
+                matches.append(
+                    signal_base.SignalMatch(
+                        signal_attr.labels, signal_attr.first_descriptor_id
+                    )
+                )
+        return matches
+
+    def load(self, path: pathlib.Path) -> None:
+        self._state_ints.clear()
+        super().load(path)
 
     @classmethod
     def hash_from_bytes(self, bytes_: bytes) -> str:
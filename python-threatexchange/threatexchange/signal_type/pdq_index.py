@@ -77,14 +77,14 @@ class PDQIndex(SignalTypeIndex):
         """
         Convert the PDQ index into a bytestream (probably a file).
         """
-        fout.write(pickle.dumps(self))
+        pickle.dump(self, fout)
 
     @classmethod
     def deserialize(cls, fin: t.BinaryIO) -> "SignalTypeIndex[IndexT]":
         """
         Instantiate an index from a previous call to serialize
         """
-        return pickle.loads(fin.read())
+        return pickle.load(fin)
 
 
 class PDQFlatIndex(PDQIndex):
@@ -11,7 +11,7 @@ import typing as t
 import pathlib
 import warnings
 
-import Levenshtein
+from rapidfuzz.distance import Levenshtein
 
 from ..descriptor import SimpleDescriptorRollup, ThreatDescriptor
 from . import signal_base
@@ -60,6 +60,8 @@ class PdqOcrSignal(signal_base.SimpleSignalType, signal_base.FileHasher):
         content_pdq_hash, _, content_ocr_text = signal_str.partition(",")
         if not content_ocr_text:
             return []
+        # Same for every candidate, so only normalize it once
+        normalized_content_str = common.normalize_string(content_ocr_text)
         matches = []
         for pdq_hash_plus_ocr, signal_attr in self.state.items():
             te_pdq_hash, te_ocr_text = pdq_hash_plus_ocr.split(",", maxsplit=1)
@@ -70,7 +72,6 @@ class PdqOcrSignal(signal_base.SimpleSignalType, signal_base.FileHasher):
                 self.PDQ_PLUS_OCR_CONFIDENT_MATCH_THRESHOLD,
             ):
                 # Check for text match
-                normalized_content_str = common.normalize_string(content_ocr_text)
                 normalized_te_str = common.normalize_string(te_ocr_text)
                 if self._levenshtein_text_match(
                     normalized_content_str,
@@ -94,5 +95,7 @@ class PdqOcrSignal(signal_base.SimpleSignalType, signal_base.FileHasher):
         # Filter out anything that can't possibly match due to len difference
         if ldiff > match_threshold:
             return False
-        distance = Levenshtein.distance(str_a, str_b)
+        # With a cutoff, the distance calculation can stop early once it's
+        # clear the strings don't match, returning match_threshold + 1
+        distance = Levenshtein.distance(str_a, str_b, score_cutoff=match_threshold)
         return distance <= match_threshold
@@ -5,11 +5,11 @@
 Wrapper around the raw text signal type.
 """
 
-import math
 import pathlib
 import typing as t
 
-import Levenshtein
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
 
 from ..descriptor import SimpleDescriptorRollup, ThreatDescriptor
 from .. import common
@@ -30,31 +30,53 @@ class RawTextSignal(signal_base.SimpleSignalType, signal_base.StrMatcher):
 
     def __init__(self) -> None:
         super().__init__()
-        self.normal_to_raw: t.Dict[str, str] = {}
+        # normalized -> raw, bucketed by the length of the normalized string
+        self.normal_to_raw_by_len: t.Dict[int, t.Dict[str, str]] = {}
 
     def match(self, content: str) -> t.List[signal_base.SignalMatch]:
         return self.match_hash(content)
 
     def match_hash(self, signal_str: str) -> t.List[signal_base.SignalMatch]:
         normalized_str = common.normalize_string(signal_str)
-        # Match considered if 95% match
-        match_threshold = math.floor(len(normalized_str) * 0.05)
-        matches = []
-        for normalized_candidate, raw in self.normal_to_raw.items():
-            ldiff = abs(len(normalized_candidate) - len(normalized_str))
-            # Filter out anything that can't possibly match due to len difference
-            # Could optimize this if needed by storing in length buckets/sorted by length
-            # (What about text content fully contained in target?)
-            if ldiff > match_threshold:
-                continue
-            distance = Levenshtein.distance(normalized_candidate, normalized_str)
-            # Linear search for fun and profit (but not efficiency)
-            if distance <= match_threshold:
-                found = self.state[raw]
-                matches.append(
-                    signal_base.SignalMatch(found.labels, found.first_descriptor_id)
-                )
-        return matches
+        # Match considered if 95% match. Integer division by 20 is the same
+        # as floor(len * 0.05), without the float multiply and floor() call
+        match_threshold = len(normalized_str) // 20
+        query_len = len(normalized_str)
+        if match_threshold == 0:
+            # Short strings only match exactly, which is just a lookup
+            raw = self.normal_to_raw_by_len.get(query_len, {}).get(normalized_str)
+            return [] if raw is None else [self._signal_match(raw)]
+        # Only look at the length buckets that could possibly match, anything
+        # else is out due to the len difference alone
+        # (What about text content fully contained in target?)
+        candidates: t.List[str] = []
+        raws: t.List[str] = []
+        for candidate_len in range(
+            query_len - match_threshold, query_len + match_threshold + 1
+        ):
+            bucket = self.normal_to_raw_by_len.get(candidate_len)
+            if bucket:
+                candidates.extend(bucket)
+                raws.extend(bucket.values())
+        # Linear search for fun and profit, but in one C call that can give up
+        # on each candidate as soon as it's past the threshold
+        found_idx = sorted(
+            idx
+            for _, _, idx in process.extract(
+                normalized_str,
+                candidates,
+                scorer=Levenshtein.distance,
+                # rapidfuzz<3 lowercases and strips punctuation by default
+                processor=None,
+                score_cutoff=match_threshold,
+                limit=None,
+            )
+        )
+        return [self._signal_match(raws[idx]) for idx in found_idx]
+
+    def _signal_match(self, raw: str) -> signal_base.SignalMatch:
+        found = self.state[raw]
+        return signal_base.SignalMatch(found.labels, found.first_descriptor_id)
 
     def process_descriptor(self, descriptor: ThreatDescriptor) -> bool:
         if not super().process_descriptor(descriptor):
@@ -64,7 +86,9 @@ class RawTextSignal(signal_base.SimpleSignalType, signal_base.StrMatcher):
 
     def _postprocess_indicator(self, indicator: str) -> None:
         normalized = common.normalize_string(indicator)
-        self.normal_to_raw[common.normalize_string(normalized)] = indicator
+        normalized = common.normalize_string(normalized)
+        bucket = self.normal_to_raw_by_len.setdefault(len(normalized), {})
+        bucket[normalized] = indicator
 
     def load(self, path: pathlib.Path) -> None:
         super().load(path)
@@ -20,19 +20,27 @@ class TrivialSignalTypeIndex(index.SignalTypeIndex):
     Index that does only exact matches and serializes with pickle
     """
 
+    __slots__ = ("state",)
+
     def __init__(self) -> None:
         self.state: t.Dict[str, t.List[t.Any]] = {}
 
+    # Same shape as the __dict__ pickled before there were __slots__, so
+    # indices serialized by older versions still load
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        return {"state": self.state}
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.state = state["state"]
+
     def query(self, hash: str) -> t.List[index.IndexMatch[index.T]]:
         return [index.IndexMatch(0, meta) for meta in self.state.get(hash, [])]
 
     def add(self, vals: t.Iterable[t.Tuple[str, t.Any]]) -> None:
+        # Bound once, the loop below runs once per entry
+        setdefault = self.state.setdefault
         for k, val in vals:
-            l = self.state.get(k)
-            if not l:
-                l = []
-                self.state[k] = l
-            l.append(val)
+            setdefault(k, []).append(val)
 
     @classmethod
     def build(cls, vals: t.Iterable[t.Tuple[str, t.Any]]):
@@ -84,7 +92,7 @@ class SignalType:
         return TrivialSignalTypeIndex
 
     @classmethod
-    def indicator_applies(cls, indicator_type: str, tags: t.List[str]) -> bool:
+    def indicator_applies(cls, indicator_type: str, tags: t.Collection[str]) -> bool:
         """Does this indicator correspond to this signal type?"""
         raise NotImplementedError
 
@@ -217,12 +225,18 @@ class SimpleSignalType(SignalType, HashMatcher):
     INDICATOR_TYPE: t.Union[str, t.Tuple[str, ...]] = ()
     TYPE_TAG: t.Optional[str] = None
 
-    @classmethod
-    def indicator_applies(cls, indicator_type: str, tags: t.List[str]) -> bool:
+    # INDICATOR_TYPE as a set, since indicator_applies() is called for
+    # every descriptor and the class constant never changes
+    _indicator_types: t.FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
         types = cls.INDICATOR_TYPE
-        if isinstance(cls.INDICATOR_TYPE, str):
-            types = (cls.INDICATOR_TYPE,)
-        if indicator_type not in types:
+        cls._indicator_types = frozenset((types,) if isinstance(types, str) else types)
+
+    @classmethod
+    def indicator_applies(cls, indicator_type: str, tags: t.Collection[str]) -> bool:
+        if indicator_type not in cls._indicator_types:
             return False
         if cls.TYPE_TAG is not None:
             return cls.TYPE_TAG in tags
@@ -265,12 +279,12 @@ class SimpleSignalType(SignalType, HashMatcher):
     def load(self, path: pathlib.Path) -> None:
         self.state.clear()
         csv.field_size_limit(path.stat().st_size)  # dodge field size problems
+        rollup_from_row = SimpleDescriptorRollup.from_row
         with path.open("r", newline="") as f:
-            for row in csv.reader(f):
-                self.state[row[0]] = SimpleDescriptorRollup.from_row(row[1:])
+            self.state.update(
+                (row[0], rollup_from_row(row[1:])) for row in csv.reader(f)
+            )
 
     def store(self, path: pathlib.Path) -> None:
-        with path.open("w+", newline="") as f:
-            writer = csv.writer(f)
-            for k, v in self.state.items():
-                writer.writerow((k,) + v.as_row())
+        with common.atomic_open(path, newline="") as f:
+            csv.writer(f).writerows(v.as_row_after(k) for k, v in self.state.items())
@@ -8,6 +8,26 @@ TEST_PDF_COMPLETE_TLSH = (
 )
 
 
+def _blank_pdf(pages: int) -> bytes:
+    """A pdf of empty pages, which pdfminer extracts as just page breaks"""
+    kids = " ".join(f"{i + 3} 0 R" for i in range(pages))
+    objs = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode(),
+    ] + [b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"] * pages
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objs) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref
+    return bytes(out)
+
+
 class TLSHHasherModuleUnitTest(unittest.TestCase):
     def test_tlsh_from_file(self):
         tlsh_complete_data_hash = tlsh_pdf.TLSHSignal.hash_from_file(
@@ -20,3 +40,20 @@ class TLSHHasherModuleUnitTest(unittest.TestCase):
         tlsh_complete_match = tlsh_pdf.TLSHSignal().match_hash(tlsh_complete_data_hash)
         tlsh_half_complete_match = tlsh_pdf.TLSHSignal().match_hash(tlsh_half_data_hash)
         assert tlsh_complete_data_hash == TEST_PDF_COMPLETE_TLSH
+
+    def test_tlsh_from_bytes(self):
+        with open("data/test_pdf_complete.pdf", "rb") as f:
+            tlsh_bytes_hash = tlsh_pdf.TLSHSignal.hash_from_bytes(f.read())
+        assert tlsh_bytes_hash == tlsh_pdf.TLSHSignal.hash_from_file(
+            "data/test_pdf_complete.pdf"
+        )
+
+    def test_tlsh_from_files(self):
+        files = ["data/test_pdf_complete.pdf", "data/test_pdf_half.pdf"]
+        assert tlsh_pdf.TLSHSignal.hash_from_files(files, workers=2) == [
+            tlsh_pdf.TLSHSignal.hash_from_file(f) for f in files
+        ]
+
+    def test_tlsh_from_blank_pdf(self):
+        # Too little variation to hash, same as tlsh.hash()
+        assert tlsh_pdf.TLSHSignal.hash_from_bytes(_blank_pdf(60)) == "TNULL"
@@ -0,0 +1,77 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import io
+import random
+import unittest
+
+try:
+    import tlsh
+
+    _DISABLED = False
+except ImportError:
+    _DISABLED = True
+
+from threatexchange.signal_type.tlsh_pdf import (
+    TLSHLinearSearchIndex,
+    TLSH_CONFIDENT_MATCH_THRESHOLD,
+)
+
+
+def _random_hashes(rng: random.Random, count: int, variants: int):
+    """Random TLSH hashes, each with a few near copies"""
+    ret = []
+    for _ in range(count):
+        data = bytearray(rng.randrange(256) for _ in range(512))
+        for _ in range(variants):
+            ret.append(tlsh.hash(bytes(data)))
+            for _ in range(rng.randrange(1, 8)):
+                data[rng.randrange(len(data))] = rng.randrange(256)
+    return ret
+
+
+@unittest.skipIf(_DISABLED, "tlsh not installed")
+class TestTLSHLinearSearchIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1234)
+        self.hashes = _random_hashes(rng, 40, 5)
+        self.entries = [(h, i) for i, h in enumerate(self.hashes)]
+        self.index = TLSHLinearSearchIndex.build(self.entries)
+
+    def linear_scan(self, query):
+        return {
+            (tlsh.diffxlen(h, query), i)
+            for h, i in self.entries
+            if tlsh.diffxlen(h, query) <= TLSH_CONFIDENT_MATCH_THRESHOLD
+        }
+
+    def assert_matches_linear_scan(self, index):
+        for query in self.hashes:
+            self.assertEqual(
+                self.linear_scan(query),
+                {(m.distance, m.metadata) for m in index.query(query)},
+            )
+
+    def test_query(self):
+        self.assert_matches_linear_scan(self.index)
+
+    def test_incremental_add(self):
+        index = TLSHLinearSearchIndex()
+        for entry in self.entries:
+            index.add([entry])
+        self.assert_matches_linear_scan(index)
+
+    def test_duplicate_hashes(self):
+        index = TLSHLinearSearchIndex.build(
+            [(self.hashes[0], "a"), (self.hashes[0], "b")]
+        )
+        self.assertEqual({"a", "b"}, {m.metadata for m in index.query(self.hashes[0])})
+
+    def test_empty_and_bad_query(self):
+        self.assertEqual([], TLSHLinearSearchIndex.build([]).query(self.hashes[0]))
+        self.assertEqual([], self.index.query("not a tlsh hash"))
+
+    def test_serialize(self):
+        buf = io.BytesIO()
+        self.index.serialize(buf)
+        buf.seek(0)
+        self.assert_matches_linear_scan(TLSHLinearSearchIndex.deserialize(buf))
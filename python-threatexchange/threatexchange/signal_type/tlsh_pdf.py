@@ -5,16 +5,113 @@
 Wrapper around the pdf signal type.
 """
 
+import multiprocessing
 import pathlib
+import pickle
 import typing as t
 import warnings
-from io import StringIO
+from io import BytesIO
 
 from ..descriptor import SimpleDescriptorRollup, ThreatDescriptor
-from . import signal_base
+from . import index, signal_base
+from ..hashing.pdq_utils import simple_distance_int
 
 TLSH_CONFIDENT_MATCH_THRESHOLD = 30
 EXPECT_TLSH_HASH_LENGTH = 72
+# Where the parts of a "T1" hash are in the hex string. The body is the bucket
+# counts, after the version, checksum, length and quartile ratios
+TLSH_Q1_RATIO_INDEX = 6
+TLSH_Q2_RATIO_INDEX = 7
+TLSH_BODY_HEX_LENGTH = 64
+
+
+class TLSHLinearSearchIndex(index.SignalTypeIndex):
+    """
+    Compares the query against every stored TLSH hash, which is exact.
+
+    Most stored hashes are ruled out by _could_match() without calling into
+    tlsh, so this is still reasonably quick for moderately sized datasets.
+    """
+
+    def __init__(self, threshold: int = TLSH_CONFIDENT_MATCH_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.state: t.Dict[str, t.List[t.Any]] = {}
+        # hash -> _parse_header_and_body(hash) for hashes in state
+        self._parsed: t.Dict[str, t.Optional[t.Tuple[int, int, int]]] = {}
+
+    def query(self, hash: str) -> t.List[index.IndexMatch[index.T]]:
+        if len(hash) != EXPECT_TLSH_HASH_LENGTH:
+            return []
+        import tlsh
+
+        threshold = self.threshold
+        query = _parse_header_and_body(hash)
+        ret: t.List[index.IndexMatch[index.T]] = []
+        for tlsh_hash, parsed in self._parsed.items():
+            if not _could_match(parsed, query, threshold):
+                continue
+            distance = tlsh.diffxlen(tlsh_hash, hash)
+            if distance <= threshold:
+                ret.extend(index.IndexMatch(distance, m) for m in self.state[tlsh_hash])
+        return ret
+
+    def add(self, vals: t.Iterable[t.Tuple[str, t.Any]]) -> None:
+        for k, val in vals:
+            metas = self.state.get(k)
+            if metas is None:
+                metas = self.state[k] = []
+                self._parsed[k] = _parse_header_and_body(k)
+            metas.append(val)
+
+    @classmethod
+    def build(cls, vals: t.Iterable[t.Tuple[str, t.Any]]):
+        ret = cls()
+        ret.add(vals=vals)
+        return ret
+
+    def serialize(self, fout: t.BinaryIO):
+        pickle.dump(self, fout)
+
+    @classmethod
+    def deserialize(cls, fin: t.BinaryIO):
+        return pickle.load(fin)
+
+
+class _TLSHWriter:
+    """
+    Enough of a binary file for pdfminer's TextConverter to write into,
+    where everything written is added to a TLSH hash.
+
+    pdfminer writes a character or so at a time, and py-tlsh gives different
+    results for lots of tiny updates, so writes are batched up first.
+    """
+
+    mode = "wb"
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, tlsh_hash) -> None:
+        self._tlsh = tlsh_hash
+        self._buffer = bytearray()
+
+    def write(self, b: bytes) -> int:
+        self._buffer += b
+        if len(self._buffer) >= self.BUFFER_SIZE:
+            self._flush()
+        return len(b)
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._tlsh.update(bytes(self._buffer))
+            self._buffer.clear()
+
+    def hexdigest(self) -> str:
+        self._flush()
+        try:
+            self._tlsh.final()
+            return self._tlsh.hexdigest()
+        except ValueError:
+            # Too little or too uniform input, tlsh.hash() returns this too
+            return "TNULL"
 
 
 class TLSHSignal(
@@ -30,12 +127,45 @@ class TLSHSignal(
     INDICATOR_TYPE = "HASH_TEXT_TLSH"
     TYPE_TAG = "media_type_pdf"
 
+    def __init__(self) -> None:
+        super().__init__()
+        # hash -> _parse_header_and_body(hash) for hashes in state
+        self._state_parsed: t.Dict[str, t.Optional[t.Tuple[int, int, int]]] = {}
+
+    @classmethod
+    def get_index_cls(cls) -> t.Type[index.SignalTypeIndex]:
+        return TLSHLinearSearchIndex
+
     @classmethod
     def hash_from_file(cls, file: pathlib.Path) -> str:
         if not str(file).endswith(".pdf"):
             warnings.warn("File does not appear to be a pdf. ", category=UserWarning)
             return ""
 
+        with open(file, "rb") as in_file:
+            return cls._hash_pdf(in_file)
+
+    @classmethod
+    def hash_from_files(
+        cls, files: t.Sequence[pathlib.Path], workers: t.Optional[int] = None
+    ) -> t.List[str]:
+        """
+        hash_from_file() for many files, spread across processes.
+
+        pdfminer is pure python, so threads wouldn't help, but each file
+        can be hashed on its own. workers defaults to the number of CPUs.
+        """
+        if len(files) < 2:
+            return [cls.hash_from_file(f) for f in files]
+        with multiprocessing.Pool(workers) as pool:
+            return pool.map(cls.hash_from_file, files)
+
+    @classmethod
+    def hash_from_bytes(cls, bytes_: bytes) -> str:
+        return cls._hash_pdf(BytesIO(bytes_))
+
+    @classmethod
+    def _hash_pdf(cls, in_file: t.BinaryIO) -> str:
         try:
             import tlsh
             from pdfminer.converter import TextConverter
@@ -50,16 +180,19 @@ class TLSHSignal(
                 category=UserWarning,
             )
             return ""
-        text = StringIO()
-        with open(file, "rb") as in_file:
-            parser = PDFParser(in_file)
-            doc = PDFDocument(parser)
-            rsrcmgr = PDFResourceManager()
-            device = TextConverter(rsrcmgr, text, laparams=LAParams())
-            interpreter = PDFPageInterpreter(rsrcmgr, device)
-            for page in PDFPage.create_pages(doc):
-                interpreter.process_page(page)
-            return str(tlsh.hash(text.getvalue().encode()))
+        # Feed the extracted text straight into the hash as pdfminer produces
+        # it, rather than holding (and then encoding) the whole document
+        hasher = _TLSHWriter(tlsh.Tlsh())
+        parser = PDFParser(in_file)
+        doc = PDFDocument(parser)
+        rsrcmgr = PDFResourceManager()
+        # Only write() is ever called, which is all _TLSHWriter implements
+        outfp = t.cast(t.BinaryIO, hasher)
+        device = TextConverter(rsrcmgr, outfp, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.create_pages(doc):
+            interpreter.process_page(page)
+        return hasher.hexdigest()
 
     def match_hash(self, signal_str: str) -> t.List[signal_base.SignalMatch]:
         matches = []
@@ -71,15 +204,73 @@ class TLSHSignal(
                 category=UserWarning,
             )
             return []
-        if len(signal_str) == EXPECT_TLSH_HASH_LENGTH:
-            for tlsh_hash, signal_attr in self.state.items():
-                if (
-                    tlsh.diffxlen(tlsh_hash, signal_str)
-                    <= TLSH_CONFIDENT_MATCH_THRESHOLD
-                ):
-                    matches.append(
-                        signal_base.SignalMatch(
-                            signal_attr.labels, signal_attr.first_descriptor_id
-                        )
+        if len(signal_str) != EXPECT_TLSH_HASH_LENGTH:
+            return []
+        threshold = TLSH_CONFIDENT_MATCH_THRESHOLD
+        query = _parse_header_and_body(signal_str)
+        state_parsed = self._state_parsed
+        for tlsh_hash, signal_attr in self.state.items():
+            if tlsh_hash in state_parsed:
+                parsed = state_parsed[tlsh_hash]
+            else:
+                parsed = state_parsed[tlsh_hash] = _parse_header_and_body(tlsh_hash)
+            if not _could_match(parsed, query, threshold):
+                continue
+            if tlsh.diffxlen(tlsh_hash, signal_str) <= threshold:
+                matches.append(
+                    signal_base.SignalMatch(
+                        signal_attr.labels, signal_attr.first_descriptor_id
                     )
+                )
         return matches
+
+    def load(self, path: pathlib.Path) -> None:
+        self._state_parsed.clear()
+        super().load(path)
+
+
+def _parse_header_and_body(tlsh_hash: str) -> t.Optional[t.Tuple[int, int, int]]:
+    """(q1 ratio, q2 ratio, body as an int), or None if it doesn't look like TLSH"""
+    if len(tlsh_hash) != EXPECT_TLSH_HASH_LENGTH:
+        return None
+    try:
+        return (
+            int(tlsh_hash[TLSH_Q1_RATIO_INDEX], 16),
+            int(tlsh_hash[TLSH_Q2_RATIO_INDEX], 16),
+            int(tlsh_hash[-TLSH_BODY_HEX_LENGTH:], 16),
+        )
+    except ValueError:
+        return None
+
+
+def _could_match(
+    a: t.Optional[t.Tuple[int, int, int]],
+    b: t.Optional[t.Tuple[int, int, int]],
+    threshold: int,
+) -> bool:
+    """
+    False if the _parse_header_and_body() of two hashes rules out diffxlen()
+    being within threshold, using cheap lower bounds to skip most unrelated
+    hashes without calling into tlsh:
+     * Each body bucket is 2 bits, and adds at least 1 to the distance if it
+       differs, so half the differing body bits is a lower bound. This one is
+       a single int op, so it goes first.
+     * The quartile ratios are in the header, and add to the distance on top
+       of the body. They're scored the same way tlsh does.
+    """
+    if a is None or b is None:
+        return True
+    bound = (simple_distance_int(a[2], b[2]) + 1) // 2
+    if bound > threshold:
+        return False
+    bound += _q_ratio_distance(a[0], b[0]) + _q_ratio_distance(a[1], b[1])
+    return bound <= threshold
+
+
+def _q_ratio_distance(a: int, b: int) -> int:
+    """How tlsh scores the difference between two quartile ratios"""
+    diff = abs(a - b)
+    diff = min(diff, 16 - diff)
+    if diff <= 1:
+        return diff
+    return (diff - 1) * 12
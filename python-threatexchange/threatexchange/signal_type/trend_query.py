@@ -11,6 +11,7 @@ import pathlib
 import re
 import typing as t
 
+from .. import common
 from ..descriptor import SimpleDescriptorRollup, ThreatDescriptor
 from . import signal_base
 
@@ -107,11 +108,11 @@ class TrendQuerySignal(signal_base.SignalType, signal_base.StrMatcher):
                 )
 
     def store(self, path: pathlib.Path) -> None:
-        with path.open("w+", newline="") as f:
-            writer = csv.writer(f, dialect="excel-tab")
-            for k, v in self.state.items():
-                writer.writerow((k,) + v[1].as_row())
+        with common.atomic_open(path, newline="") as f:
+            csv.writer(f, dialect="excel-tab").writerows(
+                v[1].as_row_after(k) for k, v in self.state.items()
+            )
 
     @classmethod
-    def indicator_applies(cls, indicator_type: str, tags: t.List[str]) -> bool:
+    def indicator_applies(cls, indicator_type: str, tags: t.Collection[str]) -> bool:
         return indicator_type == "DEBUG_STRING" and "media_type_trend_query" in tags
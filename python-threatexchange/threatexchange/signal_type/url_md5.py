@@ -5,7 +5,7 @@
 Wrapper around the URL MD5 signal types.
 """
 
-import hashlib
+import functools
 
 from ..descriptor import SimpleDescriptorRollup, ThreatDescriptor
 from . import signal_base
@@ -22,6 +22,12 @@ class UrlMD5Signal(signal_base.SimpleSignalType, signal_base.StrHasher):
 
     @classmethod
     def hash_from_str(cls, url: str) -> str:
-        encoded_url = common.normalize_url(url)
-        url_hash = hashlib.md5(encoded_url)
-        return url_hash.hexdigest()
+        return _hash_url(url)
+
+
+# URL feeds see the same URLs over and over, and normalizing them is most of
+# the cost of hashing, so remember the recent ones
+@functools.lru_cache(maxsize=1 << 17)
+def _hash_url(url: str) -> str:
+    # normalize_url() already returns utf-8 bytes
+    return common.md5(common.normalize_url(url)).hexdigest()
@@ -11,6 +11,7 @@ import time
 import typing as t
 from dataclasses import dataclass
 
+from . import common
 from .api import ThreatExchangeAPI, _CursoredResponse
 from .dataset import Dataset
 from .descriptor import SimpleDescriptorRollup
@@ -234,6 +235,13 @@ class ThreatUpdatesDelta:
                         return
 
 
+# See ThreatUpdateCheckpoint docstring about tailing fast enough.
+# Not on the class: NamedTuple turns annotated attributes into fields, which
+# made this the first positional argument and caused loaded checkpoints to be
+# read back into the wrong fields
+_DEFAULT_REFETCH_SEC = 3600 * 24 * 85  # 85 days
+
+
 class ThreatUpdateCheckpoint(t.NamedTuple):
     """
     State about the progress of a /threat_updates-backed state.
@@ -245,9 +253,6 @@ class ThreatUpdateCheckpoint(t.NamedTuple):
     https://developers.facebook.com/docs/threat-exchange/reference/apis/threat-updates/
     """
 
-    # See docstring about tailing fast enough
-    DEFAULT_REFETCH_SEC: int = 3600 * 24 * 85  # 85 days
-
     # When was the last time we started or the furthest we've seen,
     # to check against the store getting too stale
     last_fetch_time: int = 0
@@ -269,7 +274,7 @@ class ThreatUpdateCheckpoint(t.NamedTuple):
     @property
     def stale(self):
         """Is this checkpoint so old as to be invalid?"""
-        return self.last_fetch_time + self.DEFAULT_REFETCH_SEC < time.time()
+        return self.last_fetch_time + _DEFAULT_REFETCH_SEC < time.time()
 
 
 class ThreatUpdatesStore:
@@ -382,18 +387,20 @@ class ThreatUpdateFileStore(ThreatUpdatesStore):
 
     def _load_checkpoint(self) -> ThreatUpdateCheckpoint:
         """Load the state of the threat_updates checkpoints from state directory"""
-        if not self.checkpoint_file.exists():
+        try:
+            f = self.checkpoint_file.open("r")
+        except FileNotFoundError:
             return ThreatUpdateCheckpoint()
 
-        with self.checkpoint_file.open("r") as f:
+        with f:
             checkpoint_json = json.load(f)
             return ThreatUpdateCheckpoint(
-                checkpoint_json["last_fetch_time"],
-                checkpoint_json["fetch_checkpoint"],
+                last_fetch_time=checkpoint_json["last_fetch_time"],
+                fetch_checkpoint=checkpoint_json["fetch_checkpoint"],
             )
 
     def _store_checkpoint(self, checkpoint: ThreatUpdateCheckpoint) -> None:
-        with self.checkpoint_file.open("w") as f:
+        with common.atomic_open(self.checkpoint_file) as f:
             json.dump(
                 {
                     "last_fetch_time": checkpoint.last_fetch_time,